@@ -284,7 +284,7 @@ class MockMTDomeController:
         self.log.debug("Determining current TAI.")
         await self.determine_current_tai()
         self.log.debug(f"Requesting status for LLC {llc_name}")
-        await llc.determine_status(self.current_tai)
+        llc.determine_status(self.current_tai)
         state = {llc_name.value: llc.llc_status}
         await self.write(response=ResponseCode.OK, **state)
 
@@ -318,7 +318,7 @@ class MockMTDomeController:
 
         # No conversion from radians to degrees needed since both the commands
         # and the mock az controller use radians.
-        return await self.amcs.moveAz(position, velocity, self.current_tai)
+        return self.amcs.moveAz(position, velocity, self.current_tai)
 
     async def move_el(self, position):
         """Move the light and wind screen.
@@ -337,7 +337,7 @@ class MockMTDomeController:
 
         # No conversion from radians to degrees needed since both the commands
         # and the mock az controller use radians.
-        return await self.lwscs.moveEl(position, self.current_tai)
+        return self.lwscs.moveEl(position, self.current_tai)
 
     async def stop_az(self):
         """Stop all dome motion.
@@ -348,7 +348,7 @@ class MockMTDomeController:
             The estimated duration of the execution of the command.
         """
         self.log.info("Received command 'stopAz'")
-        return await self.amcs.stopAz(self.current_tai)
+        return self.amcs.stopAz(self.current_tai)
 
     async def stop_el(self):
         """Stop all light and wind screen motion.
@@ -359,7 +359,7 @@ class MockMTDomeController:
             The estimated duration of the execution of the command.
         """
         self.log.info("Received command 'stopEl'")
-        return await self.lwscs.stopEl(self.current_tai)
+        return self.lwscs.stopEl(self.current_tai)
 
     async def stop_llc(self):
         """Move all lower level components."""
@@ -385,7 +385,7 @@ class MockMTDomeController:
 
         # No conversion from radians to degrees needed since both the commands
         # and the mock az controller use radians.
-        return await self.amcs.crawlAz(velocity, self.current_tai)
+        return self.amcs.crawlAz(velocity, self.current_tai)
 
     async def crawl_el(self, velocity):
         """Crawl the light and wind screen.
@@ -404,7 +404,7 @@ class MockMTDomeController:
 
         # No conversion from radians to degrees needed since both the commands
         # and the mock az controller use radians.
-        return await self.lwscs.crawlEl(velocity, self.current_tai)
+        return self.lwscs.crawlEl(velocity, self.current_tai)
 
     async def set_louvers(self, position):
         """Set the positions of the louvers.
@@ -418,32 +418,32 @@ class MockMTDomeController:
         self.log.info(
             f"Received command 'setLouvers' with argument position={position}"
         )
-        await self.lcs.setLouvers(position)
+        self.lcs.setLouvers(position, self.current_tai)
 
     async def close_louvers(self):
         """Close all louvers."""
         self.log.info("Received command 'closeLouvers'")
-        await self.lcs.closeLouvers()
+        self.lcs.closeLouvers(self.current_tai)
 
     async def stop_louvers(self):
         """Stop the motion of all louvers."""
         self.log.info("Received command 'stopLouvers'")
-        await self.lcs.stopLouvers()
+        self.lcs.stopLouvers(self.current_tai)
 
     async def open_shutter(self):
         """Open the shutter."""
         self.log.info("Received command 'openShutter'")
-        await self.apscs.openShutter()
+        self.apscs.openShutter(self.current_tai)
 
     async def close_shutter(self):
         """Close the shutter."""
         self.log.info("Received command 'closeShutter'")
-        await self.apscs.closeShutter()
+        self.apscs.closeShutter(self.current_tai)
 
     async def stop_shutter(self):
         """Stop the motion of the shutter."""
         self.log.info("Received command 'stopShutter'")
-        await self.apscs.stopShutter()
+        self.apscs.stopShutter(self.current_tai)
 
     async def config(self, system, settings):
         """Configure the lower level components.
@@ -501,7 +501,7 @@ class MockMTDomeController:
             The estimated duration of the execution of the command.
         """
         self.log.info("Received command 'park'")
-        return await self.amcs.park(self.current_tai)
+        return self.amcs.park(self.current_tai)
 
     async def set_temperature(self, temperature):
         """Set the preferred temperature in the dome.
@@ -514,7 +514,7 @@ class MockMTDomeController:
         self.log.info(
             f"Received command 'setTemperature' with argument temperature={temperature}"
         )
-        await self.thcs.setTemperature(temperature)
+        self.thcs.setTemperature(temperature, self.current_tai)
 
     async def inflate(self, action):
         """Inflate or deflate the inflatable seal.
@@ -525,7 +525,7 @@ class MockMTDomeController:
             ON means inflate and OFF deflate the inflatable seal.
         """
         self.log.info(f"Received command 'inflate' with argument action={action}")
-        await self.amcs.inflate(action)
+        self.amcs.inflate(action)
 
     async def fans(self, action):
         """Enable or disable the fans in the dome.
@@ -536,7 +536,7 @@ class MockMTDomeController:
             ON means fans on and OFF fans off.
         """
         self.log.info(f"Received command 'fans' with argument action={action}")
-        await self.amcs.fans(action)
+        self.amcs.fans(action)
 
 
 async def main():
@@ -24,8 +24,6 @@ __all__ = ["AmcsStatus", "PARK_POSITION"]
 import logging
 import math
 
-import numpy as np
-
 from .base_mock_llc import BaseMockStatus
 from ..llc_configuration_limits.amcs_limits import AmcsLimits
 from lsst.ts.idl.enums.MTDome import MotionState
@@ -73,16 +71,41 @@ class AmcsStatus(BaseMockStatus):
         self.seal_inflated = OnOff.OFF
         self.position_commanded = PARK_POSITION
         self.velocity_commanded = PARK_POSITION
-        self.drive_torque_actual = np.zeros(_NUM_MOTORS, dtype=float)
-        self.drive_torque_commanded = np.zeros(_NUM_MOTORS, dtype=float)
-        self.drive_current_actual = np.zeros(_NUM_MOTORS, dtype=float)
-        self.drive_temperature = np.full(_NUM_MOTORS, 20.0, dtype=float)
-        self.encoder_head_raw = np.zeros(_NUM_ENCODERS, dtype=float)
-        self.encoder_head_calibrated = np.zeros(_NUM_ENCODERS, dtype=float)
-        self.resolver_raw = np.zeros(_NUM_RESOLVERS, dtype=float)
-        self.resolver_calibrated = np.zeros(_NUM_RESOLVERS, dtype=float)
-
-    async def determine_status(self, current_tai):
+        self.drive_torque_actual = [0.0] * _NUM_MOTORS
+        self.drive_torque_commanded = [0.0] * _NUM_MOTORS
+        self.drive_current_actual = [0.0] * _NUM_MOTORS
+        self.drive_temperature = [20.0] * _NUM_MOTORS
+        self.encoder_head_raw = [0.0] * _NUM_ENCODERS
+        self.encoder_head_calibrated = [0.0] * _NUM_ENCODERS
+        self.resolver_raw = [0.0] * _NUM_RESOLVERS
+        self.resolver_calibrated = [0.0] * _NUM_RESOLVERS
+        # The status dict is built once and only the values that change get
+        # updated in determine_status or, for the fans and inflate values, in
+        # the command that changes them. The motor, encoder and resolver lists
+        # are shared with the dict so they need to be modified in place.
+        self.llc_status = {
+            "status": {
+                "error": self.error,
+                "status": self.status.name,
+                "fans": self.fans_enabled.value,
+                "inflate": self.seal_inflated.value,
+            },
+            "positionActual": PARK_POSITION,
+            "positionCommanded": self.position_commanded,
+            "velocityActual": 0.0,
+            "velocityCommanded": self.velocity_commanded,
+            "driveTorqueActual": self.drive_torque_actual,
+            "driveTorqueCommanded": self.drive_torque_commanded,
+            "driveCurrentActual": self.drive_current_actual,
+            "driveTemperature": self.drive_temperature,
+            "encoderHeadRaw": self.encoder_head_raw,
+            "encoderHeadCalibrated": self.encoder_head_calibrated,
+            "resolverRaw": self.resolver_raw,
+            "resolverCalibrated": self.resolver_calibrated,
+            "timestampUTC": start_tai,
+        }
+
+    def determine_status(self, current_tai):
         """Determine the status of the Lower Level Component and store it in
         the llc_status `dict`.
 
@@ -98,31 +121,17 @@ class AmcsStatus(BaseMockStatus):
             velocity,
             motion_state,
         ) = self.azimuth_motion.get_position_velocity_and_motion_state(tai=current_tai)
-        self.llc_status = {
-            "status": {
-                "error": self.error,
-                "status": motion_state.name,
-                "fans": self.fans_enabled.value,
-                "inflate": self.seal_inflated.value,
-            },
-            "positionActual": position,
-            "positionCommanded": self.position_commanded,
-            "velocityActual": velocity,
-            "velocityCommanded": self.velocity_commanded,
-            "driveTorqueActual": self.drive_torque_actual.tolist(),
-            "driveTorqueCommanded": self.drive_torque_commanded.tolist(),
-            "driveCurrentActual": self.drive_current_actual.tolist(),
-            "driveTemperature": self.drive_temperature.tolist(),
-            "encoderHeadRaw": self.encoder_head_raw.tolist(),
-            "encoderHeadCalibrated": self.encoder_head_calibrated.tolist(),
-            "resolverRaw": self.resolver_raw.tolist(),
-            "resolverCalibrated": self.resolver_calibrated.tolist(),
-            "timestampUTC": current_tai,
-        }
-
-        self.log.debug(f"amcs_state = {self.llc_status}")
-
-    async def moveAz(self, position, velocity, start_tai):
+        status = self.llc_status["status"]
+        status["error"] = self.error
+        status["status"] = motion_state.name
+        self.llc_status["positionActual"] = position
+        self.llc_status["positionCommanded"] = self.position_commanded
+        self.llc_status["velocityActual"] = velocity
+        self.llc_status["velocityCommanded"] = self.velocity_commanded
+        self.llc_status["timestampUTC"] = current_tai
+        self.log.debug("amcs_state = %s", self.llc_status)
+
+    def moveAz(self, position, velocity, start_tai):
         """Move the dome at maximum velocity to the specified azimuth. Azimuth
         is measured from 0 at north via 90 at east and 180 at south to 270 west
         and 360 = 0. The value of azimuth is not checked for the range between
@@ -151,7 +160,7 @@ class AmcsStatus(BaseMockStatus):
         )
         return self.duration
 
-    async def crawlAz(self, velocity, start_tai):
+    def crawlAz(self, velocity, start_tai):
         """Crawl the dome in the given direction at the given velocity.
 
         Parameters
@@ -178,7 +187,7 @@ class AmcsStatus(BaseMockStatus):
         )
         return self.duration
 
-    async def stopAz(self, start_tai):
+    def stopAz(self, start_tai):
         """Stop all motion of the dome.
 
         Parameters
@@ -192,7 +201,7 @@ class AmcsStatus(BaseMockStatus):
         self.duration = 0.0
         return self.duration
 
-    async def park(self, start_tai):
+    def park(self, start_tai):
         """Park the dome by moving it to azimuth 0.
 
 
@@ -208,7 +217,7 @@ class AmcsStatus(BaseMockStatus):
         self.duration = self.azimuth_motion.park(start_tai)
         return self.duration
 
-    async def inflate(self, action):
+    def inflate(self, action):
         """Inflate or deflate the inflatable seal.
 
         This is a placeholder for now until it becomes clear what this command
@@ -221,10 +230,11 @@ class AmcsStatus(BaseMockStatus):
             here.
         """
         self.seal_inflated = OnOff(action)
+        self.llc_status["status"]["inflate"] = self.seal_inflated.value
         self.duration = 0.0
         return self.duration
 
-    async def fans(self, action):
+    def fans(self, action):
         """Enable or disable the fans in the dome.
 
         This is a placeholder for now until it becomes clear what this command
@@ -237,5 +247,6 @@ class AmcsStatus(BaseMockStatus):
             here.
         """
         self.fans_enabled = OnOff(action)
+        self.llc_status["status"]["fans"] = self.fans_enabled.value
         self.duration = 0.0
         return self.duration
@@ -24,7 +24,6 @@ __all__ = ["ApscsStatus"]
 import logging
 import numpy as np
 
-from lsst.ts import salobj
 from .base_mock_llc import BaseMockStatus
 from lsst.ts.idl.enums.MTDome import MotionState
 
@@ -51,7 +50,7 @@ class ApscsStatus(BaseMockStatus):
         self.resolver_head_calibrated = np.zeros(_NUM_MOTORS, dtype=float)
         self.power_draw = 0.0
 
-    async def determine_status(self, current_tai):
+    def determine_status(self, current_tai):
         """Determine the status of the Lower Level Component and store it in
         the llc_status `dict`.
         """
@@ -73,28 +72,52 @@ class ApscsStatus(BaseMockStatus):
             "powerDraw": self.power_draw,
             "timestampUTC": current_tai,
         }
-        self.log.debug(f"apcs_state = {self.llc_status}")
+        self.log.debug("apcs_state = %s", self.llc_status)
 
-    async def openShutter(self):
-        """Open the shutter."""
+    def openShutter(self, start_tai):
+        """Open the shutter.
+
+        Parameters
+        ----------
+        start_tai: `float`
+            The TAI time, unix seconds, when the command was issued. To model
+            the real dome, this should be the current time. However, for unit
+            tests it can be convenient to use other values.
+        """
         self.log.debug("Received command 'openShutter'")
-        self.command_time_tai = salobj.current_tai()
+        self.command_time_tai = start_tai
         self.status = MotionState.OPEN
         # Both positions are expressed in percentage.
         self.position_actual = 100.0
         self.position_commanded = 100.0
 
-    async def closeShutter(self):
-        """Close the shutter."""
+    def closeShutter(self, start_tai):
+        """Close the shutter.
+
+        Parameters
+        ----------
+        start_tai: `float`
+            The TAI time, unix seconds, when the command was issued. To model
+            the real dome, this should be the current time. However, for unit
+            tests it can be convenient to use other values.
+        """
         self.log.debug("Received command 'closeShutter'")
-        self.command_time_tai = salobj.current_tai()
+        self.command_time_tai = start_tai
         self.status = MotionState.CLOSED
         # Both positions are expressed in percentage.
         self.position_actual = 0.0
         self.position_commanded = 0.0
 
-    async def stopShutter(self):
-        """Stop all motion of the shutter."""
+    def stopShutter(self, start_tai):
+        """Stop all motion of the shutter.
+
+        Parameters
+        ----------
+        start_tai: `float`
+            The TAI time, unix seconds, when the command was issued. To model
+            the real dome, this should be the current time. However, for unit
+            tests it can be convenient to use other values.
+        """
         self.log.debug("Received command 'stopShutter'")
-        self.command_time_tai = salobj.current_tai()
+        self.command_time_tai = start_tai
         self.status = MotionState.STOPPED
@@ -24,7 +24,6 @@ __all__ = ["LcsStatus", "NUM_LOUVERS"]
 import logging
 import numpy as np
 
-from lsst.ts import salobj
 from .base_mock_llc import BaseMockStatus
 from lsst.ts.idl.enums.MTDome import MotionState
 
@@ -55,7 +54,7 @@ class LcsStatus(BaseMockStatus):
         self.encoder_head_calibrated = np.zeros(_NUM_MOTORS, dtype=float)
         self.power_draw = 0.0
 
-    async def determine_status(self, current_tai):
+    def determine_status(self, current_tai):
         """Determine the status of the Lower Level Component and store it in
         the llc_status `dict`.
         """
@@ -77,9 +76,9 @@ class LcsStatus(BaseMockStatus):
             "powerDraw": self.power_draw,
             "timestampUTC": current_tai,
         }
-        self.log.debug(f"lcs_state = {self.llc_status}")
+        self.log.debug("lcs_state = %s", self.llc_status)
 
-    async def setLouvers(self, position):
+    def setLouvers(self, position, start_tai):
         """Set the position of the louver with the given louver_id.
 
         Parameters
@@ -88,8 +87,12 @@ class LcsStatus(BaseMockStatus):
             An array with the positions (percentage) to set the louvers to. 0
             means closed, 180 means wide open, -1 means do not move. These
             limits are not checked.
+        start_tai: `float`
+            The TAI time, unix seconds, when the command was issued. To model
+            the real dome, this should be the current time. However, for unit
+            tests it can be convenient to use other values.
         """
-        self.command_time_tai = salobj.current_tai()
+        self.command_time_tai = start_tai
         for louver_id, pos in enumerate(position):
             if pos >= 0:
                 if pos > 0:
@@ -99,14 +102,30 @@ class LcsStatus(BaseMockStatus):
                 self.position_actual[louver_id] = pos
                 self.position_commanded[louver_id] = pos
 
-    async def closeLouvers(self):
-        """Close all louvers."""
-        self.command_time_tai = salobj.current_tai()
+    def closeLouvers(self, start_tai):
+        """Close all louvers.
+
+        Parameters
+        ----------
+        start_tai: `float`
+            The TAI time, unix seconds, when the command was issued. To model
+            the real dome, this should be the current time. However, for unit
+            tests it can be convenient to use other values.
+        """
+        self.command_time_tai = start_tai
         self.status[:] = MotionState.CLOSED.name
         self.position_actual[:] = 0.0
         self.position_commanded[:] = 0.0
 
-    async def stopLouvers(self):
-        """Stop all motion of all louvers."""
-        self.command_time_tai = salobj.current_tai()
+    def stopLouvers(self, start_tai):
+        """Stop all motion of all louvers.
+
+        Parameters
+        ----------
+        start_tai: `float`
+            The TAI time, unix seconds, when the command was issued. To model
+            the real dome, this should be the current time. However, for unit
+            tests it can be convenient to use other values.
+        """
+        self.command_time_tai = start_tai
         self.status[:] = MotionState.STOPPED.name
@@ -78,7 +78,7 @@ class LwscsStatus(BaseMockStatus):
         self.resolver_calibrated = np.zeros(_NUM_MOTORS, dtype=float)
         self.power_draw = 0.0
 
-    async def determine_status(self, current_tai):
+    def determine_status(self, current_tai):
         """Determine the status of the Lower Level Component and store it in
         the llc_status `dict`.
 
@@ -113,9 +113,9 @@ class LwscsStatus(BaseMockStatus):
             "powerDraw": self.power_draw,
             "timestampUTC": current_tai,
         }
-        self.log.debug(f"lwscs_state = {self.llc_status}")
+        self.log.debug("lwscs_state = %s", self.llc_status)
 
-    async def moveEl(self, position, start_tai):
+    def moveEl(self, position, start_tai):
         """Move the light and wind screen to the given elevation.
 
         Parameters
@@ -137,7 +137,7 @@ class LwscsStatus(BaseMockStatus):
         )
         return self.duration
 
-    async def crawlEl(self, velocity, start_tai):
+    def crawlEl(self, velocity, start_tai):
         """Crawl the light and wind screen in the given direction at the given
         velocity.
 
@@ -162,7 +162,7 @@ class LwscsStatus(BaseMockStatus):
         )
         return self.duration
 
-    async def stopEl(self, start_tai):
+    def stopEl(self, start_tai):
         """Stop moving the light and wind screen.
 
         Parameters
@@ -26,7 +26,35 @@ import math
 
 from .base_llc_motion import BaseLlcMotion
 from lsst.ts.idl.enums.MTDome import MotionState
-import lsst.ts.salobj as salobj
+
+_TWO_PI = 2.0 * math.pi
+_PARK_STATES = frozenset({MotionState.PARKING, MotionState.PARKED})
+_STOP_STATES = frozenset({MotionState.STOPPING, MotionState.STOPPED})
+# The MotionState reported while a move is in progress, keyed by the commanded
+# MotionState. Any other commanded MotionState is reported as MOVING.
+_MOVE_MOTION_STATES = {
+    MotionState.PARKING: MotionState.PARKING,
+    MotionState.STOPPING: MotionState.STOPPED,
+}
+
+
+def _wrap_rad(position):
+    """Wrap the position [rad] to the range [0, 2 pi).
+
+    Parameters
+    ----------
+    position: `float`
+        The position [rad] to wrap.
+
+    Returns
+    -------
+    wrapped_position: `float`
+        The wrapped position [rad].
+    """
+    wrapped_position = math.fmod(position, _TWO_PI)
+    if wrapped_position < 0.0:
+        wrapped_position += _TWO_PI
+    return wrapped_position
 
 
 class AzimuthMotion(BaseLlcMotion):
@@ -61,6 +89,28 @@ class AzimuthMotion(BaseLlcMotion):
             start_tai=start_tai,
         )
         self.log = logging.getLogger("MockCircularCrawlingActuator")
+        # The distance [rad], velocity [rad/s] and inverse duration [1/s] of
+        # the current move. These only change when a new command is received
+        # so they are computed once per command instead of once per status
+        # request.
+        self._distance = 0.0
+        self._move_velocity = 0.0
+        self._inv_duration = 0.0
+
+    def _update_move_parameters(self):
+        """Compute and store the distance, velocity and inverse duration of
+        the move and return its duration.
+
+        Returns
+        -------
+        duration: `float`
+            The duration [s] of the move.
+        """
+        duration = self._get_duration()
+        self._distance = self._get_distance()
+        self._move_velocity = math.copysign(self._max_speed, self._distance)
+        self._inv_duration = 1.0 / duration if duration > 0 else 0.0
+        return duration
 
     def set_target_position_and_velocity(
         self, start_tai, end_position, crawl_velocity, motion_state
@@ -109,7 +159,7 @@ class AzimuthMotion(BaseLlcMotion):
         self._start_tai = start_tai
         self._end_position = end_position
         self._crawl_velocity = crawl_velocity
-        duration = self._get_duration()
+        duration = self._update_move_parameters()
         self._end_tai = self._start_tai + duration
         return duration
 
@@ -134,17 +184,11 @@ class AzimuthMotion(BaseLlcMotion):
             The MotionState at the given TAI time.
         """
         if tai >= self._end_tai:
-            if self._commanded_motion_state in [
-                MotionState.PARKING,
-                MotionState.PARKED,
-            ]:
+            if self._commanded_motion_state in _PARK_STATES:
                 motion_state = MotionState.PARKED
                 position = self._end_position
                 velocity = 0
-            elif self._commanded_motion_state in [
-                MotionState.STOPPING,
-                MotionState.STOPPED,
-            ]:
+            elif self._commanded_motion_state in _STOP_STATES:
                 motion_state = MotionState.STOPPED
                 position = self._end_position
                 velocity = 0
@@ -167,21 +211,14 @@ class AzimuthMotion(BaseLlcMotion):
                 f"Encountered TAI {tai} which is smaller than start TAI {self._start_tai}"
             )
         else:
-            frac_time = (tai - self._start_tai) / (self._end_tai - self._start_tai)
-            distance = self._get_distance()
-            position = self._start_position + distance * frac_time
-            velocity = self._max_speed
-            if distance < 0:
-                velocity = -self._max_speed
-            if self._commanded_motion_state == MotionState.PARKING:
-                motion_state = MotionState.PARKING
-            elif self._commanded_motion_state == MotionState.STOPPING:
-                motion_state = MotionState.STOPPED
-                velocity = 0
-            else:
-                motion_state = MotionState.MOVING
+            frac_time = (tai - self._start_tai) * self._inv_duration
+            position = self._start_position + self._distance * frac_time
+            velocity = self._move_velocity
+            motion_state = _MOVE_MOTION_STATES.get(
+                self._commanded_motion_state, MotionState.MOVING
+            )
 
-        position = salobj.angle_wrap_nonnegative(math.degrees(position)).rad
+        position = _wrap_rad(position)
         return position, velocity, motion_state
 
     def stop(self, start_tai):
@@ -202,6 +239,10 @@ class AzimuthMotion(BaseLlcMotion):
         self._end_position = position
         self._crawl_velocity = 0
         self._commanded_motion_state = MotionState.STOPPING
+        # The dome stays where it is so there is no distance left to cover
+        # and the velocity is zero.
+        self._distance = 0.0
+        self._move_velocity = 0
 
     def park(self, start_tai):
         """Parks the dome.
@@ -221,5 +262,5 @@ class AzimuthMotion(BaseLlcMotion):
         self._end_position = 0
         self._crawl_velocity = 0
         self._commanded_motion_state = MotionState.PARKING
-        self._end_tai = self._start_tai + self._get_duration()
+        self._end_tai = self._start_tai + self._update_move_parameters()
         return self._end_tai
@@ -41,7 +41,7 @@ class MoncsStatus(BaseMockStatus):
         self.status = MotionState.CLOSED
         self.data = np.zeros(NUM_MON_SENSORS, dtype=float)
 
-    async def determine_status(self, current_tai):
+    def determine_status(self, current_tai):
         """Determine the status of the Lower Level Component and store it in
         the llc_status `dict`.
         """
@@ -55,4 +55,4 @@ class MoncsStatus(BaseMockStatus):
             "data": self.data.tolist(),
             "timestampUTC": current_tai,
         }
-        self.log.debug(f"moncs_state = {self.llc_status}")
+        self.log.debug("moncs_state = %s", self.llc_status)
@@ -24,7 +24,6 @@ __all__ = ["ThcsStatus", "NUM_THERMO_SENSORS"]
 import logging
 import numpy as np
 
-from lsst.ts import salobj
 from .base_mock_llc import BaseMockStatus
 from lsst.ts.idl.enums.MTDome import MotionState
 
@@ -42,7 +41,7 @@ class ThcsStatus(BaseMockStatus):
         self.status = MotionState.CLOSED
         self.temperature = np.zeros(NUM_THERMO_SENSORS, dtype=float)
 
-    async def determine_status(self, current_tai):
+    def determine_status(self, current_tai):
         """Determine the status of the Lower Level Component and store it in
         the llc_status `dict`.
         """
@@ -56,9 +55,9 @@ class ThcsStatus(BaseMockStatus):
             "temperature": self.temperature.tolist(),
             "timestampUTC": current_tai,
         }
-        self.log.debug(f"thcs_state = {self.llc_status}")
+        self.log.debug("thcs_state = %s", self.llc_status)
 
-    async def setTemperature(self, temperature):
+    def setTemperature(self, temperature, start_tai):
         """Set the preferred temperature in the dome. It should mock cooling
         down or warming up but it doesn't.
 
@@ -68,7 +67,11 @@ class ThcsStatus(BaseMockStatus):
             The preferred temperature (degrees Celsius). In reality this should
             be a realistic temperature in the range of about -30 C to +40 C but
             the provided temperature is not checked against this range.
+        start_tai: `float`
+            The TAI time, unix seconds, when the command was issued. To model
+            the real dome, this should be the current time. However, for unit
+            tests it can be convenient to use other values.
         """
-        self.command_time_tai = salobj.current_tai()
+        self.command_time_tai = start_tai
         self.status = MotionState.OPEN
         self.temperature[:] = temperature